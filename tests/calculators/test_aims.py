@@ -1,6 +1,7 @@
 import os
 import pytest
 from pathlib import Path
+from types import MappingProxyType
 
 from packaging.version import Version
 
@@ -38,7 +39,7 @@ else:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def parameters_nonperiodic():
     parameters = {
         'xc': 'pbe',
@@ -57,12 +58,13 @@ def parameters_nonperiodic():
         'compute_forces': True,
         'KS_method': 'parallel',
     }
-    return parameters
+    # read-only template shared by the whole module, tests modify their own copy
+    return MappingProxyType(parameters)
 
 @aims_prerequisites
 def test_setup_calc_params(parameters_nonperiodic):
 
-    parameters = parameters_nonperiodic
+    parameters = dict(parameters_nonperiodic)
     parameters_periodic = {
         'k_grid': '1 1 1',
         'k_grid_density': 0.1,
@@ -107,7 +109,7 @@ def test_setup_calc_params(parameters_nonperiodic):
 def test_aims_calculation(tmp_path, parameters_nonperiodic):
 
     atoms = Atoms("Si", cell=(2, 2, 2), pbc=[True] * 3)
-    parameters = parameters_nonperiodic
+    parameters = dict(parameters_nonperiodic)
     parameters.update({'k_grid': '1 1 1', 'compute_analytical_stress': '.true.'})
 
     calc = wfl.calculators.aims.Aims(
@@ -128,7 +130,7 @@ def test_generic_aims_calculation(tmp_path, parameters_nonperiodic):
     at.positions[0, 0] += 0.01
     at0 = Atoms("Si", cell=[6.0, 6.0, 6.0], positions=[[3.0, 3.0, 3.0]], pbc=False)
 
-    kw = parameters_nonperiodic
+    kw = dict(parameters_nonperiodic)
     kw.update({'k_grid': '1 1 1', 'compute_analytical_stress': '.true.', 'workdir': tmp_path})
 
     calc = (wfl.calculators.aims.Aims, [], kw)
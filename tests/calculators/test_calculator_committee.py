@@ -4,7 +4,8 @@ from ase.calculators.lj import LennardJones
 from ase.calculators.morse import MorsePotential
 from pytest import approx, raises
 
-from wfl.calculators.committee import calculate_committee
+from wfl.calculators.committee import calculate_committee, calculate
+from wfl.configset import ConfigSet, OutputSpec
 
 ref_lj_energy = -4.52573996914352
 ref_morse_energy = -3.4187397762024867
@@ -60,3 +61,60 @@ def test_calculate_committee(tmp_path):
     assert results3[0].info["committee_1_energy"] == approx(ref_morse_energy)
     assert results3[0].arrays["committee_0_forces"] == approx(ref_lj_forces)
     assert results3[0].arrays["committee_1_forces"] == approx(ref_morse_forces)
+
+
+def test_calculate_committee_autopara(tmp_path):
+    calculators = [LennardJones(), MorsePotential()]
+
+    results = calculate(ConfigSet([molecule("CH4"), molecule("CH4")]), OutputSpec("committee.xyz", file_root=tmp_path),
+                        calculators, properties=['energy', 'forces'], autopara_info={"num_python_subprocesses": 2,
+                                                                                     "num_inputs_per_python_subprocess": 1})
+    results = list(results)
+    assert len(results) == 2
+    for at in results:
+        assert at.info["committee_0_energy"] == approx(ref_lj_energy)
+        assert at.info["committee_1_energy"] == approx(ref_morse_energy)
+        assert at.arrays["committee_0_forces"] == approx(ref_lj_forces)
+        assert at.arrays["committee_1_forces"] == approx(ref_morse_forces)
+
+
+n_constructed = []
+
+
+def _lj_from_file(param_file):
+    n_constructed.append(param_file)
+    return LennardJones()
+
+
+def test_calculate_committee_reuses_constructed(tmp_path, empty_calculator_cache):
+    n_constructed.clear()
+    param_file = tmp_path / "params"
+    param_file.write_text("0")
+    calculators = [(_lj_from_file, [str(param_file)], None), (MorsePotential, None, None)]
+
+    for _ in range(2):
+        results = calculate_committee(molecule("CH4"), calculators, properties=['energy'])
+        assert results.info["committee_0_energy"] == approx(ref_lj_energy)
+        assert results.info["committee_1_energy"] == approx(ref_morse_energy)
+    assert len(n_constructed) == 1
+
+    # modified file leads to new calculator
+    param_file.write_text("10")
+    calculate_committee(molecule("CH4"), calculators, properties=['energy'])
+    assert len(n_constructed) == 2
+
+
+def test_calculate_committee_reuses_many_constructed(tmp_path, empty_calculator_cache):
+    n_constructed.clear()
+    param_files = [tmp_path / f"params_{i}" for i in range(6)]
+    for param_file in param_files:
+        param_file.write_text("0")
+    calculators = [(_lj_from_file, [str(param_file)], None) for param_file in param_files]
+
+    for _ in range(3):
+        results = calculate_committee(molecule("CH4"), calculators, properties=['energy'])
+        for i_model in range(len(calculators)):
+            assert results.info[f"committee_{i_model}_energy"] == approx(ref_lj_energy)
+
+    # each committee member built only once
+    assert sorted(n_constructed) == sorted(str(param_file) for param_file in param_files)
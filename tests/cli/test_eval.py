@@ -0,0 +1,55 @@
+from click.testing import CliRunner
+from ase.build import bulk
+from ase.calculators.emt import EMT
+from ase.io import read, write
+from pytest import approx
+
+from wfl.cli.cli import cli
+
+
+def test_eval_calculator(tmp_path):
+
+    fn_out = tmp_path / "ats_out.xyz"
+    fn_in = tmp_path / "ats_in.xyz"
+    ats_in = [bulk("Cu", cubic=True) for _ in range(3)]
+    for at_i, at in enumerate(ats_in):
+        at.rattle(0.01, seed=at_i)
+    write(fn_in, ats_in)
+
+    params = [
+        'eval',
+        'calculator',
+        f'--inputs {fn_in}',
+        f'--outputs {fn_out}',
+        '--calculator ase.calculators.emt:EMT',
+    ]
+
+    print(' '.join(params))
+    runner = CliRunner()
+    result = runner.invoke(cli, " ".join(params))
+    assert result.exit_code == 0
+
+    ats_out = read(fn_out, ":")
+    assert len(ats_out) == 3
+    for at_in, at_out in zip(ats_in, ats_out):
+        at_in.calc = EMT()
+        assert at_out.info["emt_energy"] == approx(at_in.get_potential_energy())
+
+
+def test_eval_calculator_bad_spec(tmp_path):
+
+    fn_in = tmp_path / "ats_in.xyz"
+    write(fn_in, bulk("Cu"))
+
+    params = [
+        'eval',
+        'calculator',
+        f'--inputs {fn_in}',
+        f'--outputs {tmp_path / "ats_out.xyz"}',
+        '--calculator ase.calculators.emt.EMT',
+    ]
+
+    runner = CliRunner()
+    result = runner.invoke(cli, " ".join(params))
+    assert result.exit_code != 0
+    assert "module.path:Name" in result.output
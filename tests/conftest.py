@@ -111,3 +111,9 @@ def remoteinfo_env():
 
     return remoteinfo_env_func
 
+
+@pytest.fixture()
+def empty_calculator_cache(monkeypatch):
+    """start with no calculators cached by wfl.utils.parallel.construct_calculator_picklesafe_cached"""
+    import wfl.utils.parallel
+    monkeypatch.setattr(wfl.utils.parallel, "_constructed_calculators", {})
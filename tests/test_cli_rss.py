@@ -1,6 +1,7 @@
 import os
 import warnings
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import ase.io
@@ -17,6 +18,21 @@ except:
 assets_dir = Path(__file__).parent.resolve() / "assets" / "cli_rss"
 
 
+def copy_files(src_dst_pairs):
+    # copies are independent, so overlap their I/O
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        # list() so that any exception is raised here
+        list(executor.map(lambda src_dst: shutil.copyfile(*src_dst), src_dst_pairs))
+
+
+def iter_step_files(dir):
+    # single directory pass for both buildcell and DFT outputs
+    with os.scandir(dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(".xyz") and entry.name.startswith(("initial_random_configs.", "DFT_evaluated_")):
+                yield Path(entry.path)
+
+
 def check_step(runner, step_type, seeds, iter_i):
     run_iter_s = f"run_iter_{iter_i}"
     run_iter = Path(run_iter_s)
@@ -28,10 +44,7 @@ def check_step(runner, step_type, seeds, iter_i):
         # copy files that cannot be created by CI (i.e. buildcell and vasp output) for step
         # from assets_dir
         run_iter.mkdir(parents=True, exist_ok=True)
-        for fn in (assets_dir / run_iter_s).glob("initial_random_configs.*.xyz"):
-            shutil.copy(fn, run_iter / fn.name)
-        for fn in (assets_dir / run_iter_s).glob("DFT_evaluated_*.xyz"):
-            shutil.copy(fn, run_iter / fn.name)
+        copy_files([(fn, run_iter / fn.name) for fn in iter_step_files(assets_dir / run_iter_s)])
         ## # also copy in GAP*xml files for _previous_ iteration, in case gap_fit was unstable
         ## # and produced only almost identical potential
         ## for fn in (assets_dir / run_iter_prev_s).glob("GAP*xml"):
@@ -55,47 +68,37 @@ def check_step(runner, step_type, seeds, iter_i):
     if "GAP_RSS_TEST_SETUP" in os.environ:
         # save this iter's hard-to-generate (output of buildcell, vasp) files in assets_dir
         (assets_dir / run_iter_s).mkdir(parents=True, exist_ok=True)
-        for fn in run_iter.glob("initial_random_configs.*.xyz"):
-            shutil.copy(fn, assets_dir / run_iter_s / fn.name)
-        for fn in run_iter.glob("DFT_evaluated_*.xyz"):
-            shutil.copy(fn, assets_dir / run_iter_s / fn.name)
+        copy_files([(fn, assets_dir / run_iter_s / fn.name) for fn in iter_step_files(run_iter)])
         ## # also save GAP*xml, in case gap_fit is unstable and doesn't always produce exactly identical potentials
         ## # correctness of produced potential is testing by comparing cli_rss_test_energies
         ## for fn in run_iter.glob("GAP*xml"):
             ## shutil.copy(fn, assets_dir / run_iter_s / fn.name)
 
     # save or use results so we can test that they are correct by checking GAP predictions
+    # one potential, constructed once, evaluates every config
+    pot = Potential(param_filename=str(run_iter / f"GAP_iter_{iter_i}.xml"))
+    ats = ase.io.iread(
+        run_iter / f"testing.error_database.GAP_iter_{iter_i}.xyz", ":"
+    )
     if "GAP_RSS_TEST_SETUP" in os.environ:
         # save energies of some configs for actual test
-        ats = ase.io.read(
-            run_iter / f"testing.error_database.GAP_iter_{iter_i}.xyz", ":"
-        )
-        pot = Potential(param_filename=str(run_iter / f"GAP_iter_{iter_i}.xml"))
         with open(assets_dir / run_iter_s / "cli_rss_test_energies", "w") as fout:
             for at in ats:
-                at.calc = pot
-                fout.write(f"{at.get_potential_energy()}\n")
+                fout.write(f"{pot.get_potential_energy(at)}\n")
     else:
         # test by comparing to saved energies
-        ats = ase.io.read(
-            run_iter / f"testing.error_database.GAP_iter_{iter_i}.xyz", ":"
-        )
-        pot = Potential(param_filename=str(run_iter / f"GAP_iter_{iter_i}.xml"))
-        with open(assets_dir / run_iter_s / "cli_rss_test_energies") as fin:
-            ref_energies = [float(l.strip()) for l in fin.readlines()]
+        ref_energies = np.loadtxt(assets_dir / run_iter_s / "cli_rss_test_energies", ndmin=1)
         for at, energy in zip(ats, ref_energies):
-            at.calc = pot
-            assert np.abs(at.get_potential_energy() - energy) < 1.0e-5
+            assert np.abs(pot.get_potential_energy(at) - energy) < 1.0e-5
 
 
 def do_full_test(runner, assets_dir, monkeypatch):
     # copy in config files (for prep)
-    for fn in [
+    copy_files([(assets_dir / fn, fn) for fn in [
         "LiCu.json",
         "length_scales.yaml",
         "multistage_GAP_fit_settings.template.yaml",
-    ]:
-        shutil.copy(assets_dir / fn, fn)
+    ]])
 
     # make sure env vars and basic files for buildcell, vasp are ready
     if "GAP_RSS_TEST_SETUP" in os.environ:
@@ -118,8 +121,12 @@ def do_full_test(runner, assets_dir, monkeypatch):
     # make sure nothing is parallel so things are as deterministic as possible
     monkeypatch.setenv("WFL_DETERMINISTIC_HACK", "1")
     # monkeypatch.setenv("WFL_NUM_PYTHON_SUBPROCESSES", "0")
-    monkeypatch.setenv("OMP_NUM_THREADS", "1")
     monkeypatch.setenv("WFL_GAP_FIT_OMP_NUM_THREADS", "1")
+    # also avoid oversubscription by threaded BLAS/OpenMP, consistent with the
+    # OMP_NUM_THREADS=1 requirement of tests/calculators/test_aims.py
+    for threads_env_var in ["OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS",
+                            "VECLIB_MAXIMUM_THREADS", "NUMEXPR_NUM_THREADS"]:
+        monkeypatch.setenv(threads_env_var, "1")
 
     warnings.warn("gap_fit is not stable, and test does not actually use exact "
                   "reference GAP potential, so CPU-dependent math may make this test fail.")
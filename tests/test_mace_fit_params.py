@@ -0,0 +1,170 @@
+import os
+import sys
+import json
+import shlex
+from pathlib import Path
+
+import numpy as np
+import yaml
+import pytest
+
+from ase.atoms import Atoms
+
+import wfl.fit.mace
+from wfl.fit.mace import fit, fit_multiple, _load_fit_params
+from wfl.configset import ConfigSet
+from wfl.autoparallelize.remoteinfo import RemoteInfo
+
+# stands in for mace_run_train, saves its arguments and the content of any --config file
+fake_fit_script = """
+import sys, json, yaml
+args = sys.argv[1:]
+output = {"argv": args}
+if "--config" in args:
+    with open(args[args.index("--config") + 1]) as fin:
+        output["config"] = yaml.safe_load(fin)
+with open("fake_fit.json", "w") as fout:
+    json.dump(output, fout)
+"""
+
+
+@pytest.fixture
+def fake_fit_cmd(tmp_path):
+    script = tmp_path / "fake_fit.py"
+    script.write_text(fake_fit_script)
+    return f"{shlex.quote(sys.executable)} {shlex.quote(str(script))}"
+
+
+def _fitting_configs():
+    return ConfigSet([Atoms('H2', positions=[[0, 0, 0], [0.75, 0, 0]], cell=[5, 5, 5], pbc=True)])
+
+
+def _params():
+    return {"r_max": 4.0, "max_num_epochs": np.int64(3), "swa": None, "save_cpu": True,
+            "hidden_irreps": "128x0e + 128x1o", "E0s": {5: -0.0046603}}
+
+
+def test_fit_params_file(tmp_path, fake_fit_cmd):
+    run_dir = tmp_path / "run"
+    fit(_fitting_configs(), "test", _params(), mace_fit_cmd=fake_fit_cmd, run_dir=run_dir, remote_info='_IGNORE')
+
+    output = json.loads((run_dir / "fake_fit.json").read_text())
+    assert output["argv"][0] == "--config"
+    assert len(output["argv"]) == 2
+    config = output["config"]
+    # bare flag
+    assert config["swa"] is True
+    assert config["save_cpu"] is True
+    assert config["r_max"] == 4.0
+    assert config["max_num_epochs"] == "3"
+    assert config["hidden_irreps"] == "128x0e + 128x1o"
+    # non-scalar values are passed as the same string as on the command line
+    assert config["E0s"] == "{5: -0.0046603}"
+    assert config["name"] == "test"
+    assert config["energy_key"] == "REF_energy"
+    assert Path(config["train_file"]).is_absolute()
+
+    # scratch files are removed
+    assert sorted(f.name for f in run_dir.iterdir()) == ["fake_fit.json"]
+
+
+def test_fit_params_command_line(tmp_path, fake_fit_cmd):
+    run_dir = tmp_path / "run"
+    fit(_fitting_configs(), "test", _params(), mace_fit_cmd=fake_fit_cmd, run_dir=run_dir, params_file=False,
+        remote_info='_IGNORE')
+
+    argv = json.loads((run_dir / "fake_fit.json").read_text())["argv"]
+    assert "--swa" in argv
+    assert "--save_cpu=True" in argv
+    assert "--r_max=4.0" in argv
+    assert "--max_num_epochs=3" in argv
+    assert "--hidden_irreps=128x0e + 128x1o" in argv
+    assert "--E0s={5: -0.0046603}" in argv
+    assert "--name=test" in argv
+
+
+def test_fit_dry_run_no_params_file(tmp_path, fake_fit_cmd):
+    run_dir = tmp_path / "run"
+    with pytest.warns(UserWarning, match="dry_run"):
+        assert fit(_fitting_configs(), "test", _params(), mace_fit_cmd=fake_fit_cmd, run_dir=run_dir, dry_run=True,
+                   remote_info='_IGNORE') is None
+
+    assert not (run_dir / "fake_fit.json").exists()
+    assert len(list(run_dir.glob("_MACE_params.*"))) == 0
+
+
+def test_load_fit_params(tmp_path):
+    params_file = tmp_path / "params.yaml"
+    params_file.write_text("r_max: 4.0\nE0s:\n  5: -1.0\n")
+
+    params = _load_fit_params(params_file)
+    assert params == {"r_max": 4.0, "E0s": {5: -1.0}}
+
+    # independent copy
+    params["E0s"][5] = 10.0
+    params["name"] = "test"
+    assert _load_fit_params(params_file) == {"r_max": 4.0, "E0s": {5: -1.0}}
+
+    # re-read after file is modified
+    params_file.write_text("r_max: 5.0\n")
+    stat = params_file.stat()
+    os.utime(params_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert _load_fit_params(params_file) == {"r_max": 5.0}
+
+
+def test_fit_multiple_local(tmp_path, fake_fit_cmd):
+    params_file = tmp_path / "params.yaml"
+    params_file.write_text(yaml.safe_dump({"r_max": 4.0}))
+
+    # existing model is skipped
+    (tmp_path / "run_1").mkdir()
+    (tmp_path / "run_1" / "existing.model").write_text("")
+
+    fits_kwargs = [dict(fitting_configs=_fitting_configs(), mace_name="test", mace_fit_params=params_file,
+                        mace_fit_cmd=fake_fit_cmd, run_dir=tmp_path / "run_0", dry_run=True),
+                   dict(fitting_configs=_fitting_configs(), mace_name="existing", mace_fit_params=params_file,
+                        mace_fit_cmd=fake_fit_cmd, run_dir=tmp_path / "run_1", dry_run=True)]
+    with pytest.warns(UserWarning, match="dry_run"):
+        results = fit_multiple(fits_kwargs, remote_info='_IGNORE')
+
+    assert results == [None, "existing"]
+
+
+class _FakeExPyRe:
+    events = []
+
+    def __init__(self, name, function, kwargs, **_):
+        self.mace_name = kwargs["mace_name"]
+        self.kwargs = kwargs
+        _FakeExPyRe.events.append(("create", self.mace_name))
+
+    def start(self, **_):
+        _FakeExPyRe.events.append(("start", self.mace_name))
+
+    def get_results(self, **_):
+        _FakeExPyRe.events.append(("get_results", self.mace_name))
+        return f"result_{self.mace_name}", "", ""
+
+    def mark_processed(self):
+        pass
+
+
+def test_fit_multiple_remote(tmp_path, monkeypatch):
+    monkeypatch.setattr(wfl.fit.mace, "ExPyRe", _FakeExPyRe)
+    _FakeExPyRe.events = []
+
+    (tmp_path / "run_1").mkdir()
+    (tmp_path / "run_1" / "fit_1.model").write_text("")
+
+    remote_info = RemoteInfo(sys_name="local", job_name="test_fit", resources={"max_time": "1h", "num_nodes": 1})
+    fits_kwargs = [dict(fitting_configs=_fitting_configs(), mace_name=f"fit_{i}", mace_fit_params={"r_max": 4.0},
+                        run_dir=tmp_path / f"run_{i}") for i in range(3)]
+
+    results = fit_multiple(fits_kwargs, remote_info=remote_info)
+
+    # existing model skipped, others mapped back to their own position
+    assert results == ["result_fit_0", "fit_1", "result_fit_2"]
+    # all jobs created and started before waiting for any of them
+    assert _FakeExPyRe.events == [("create", "fit_0"), ("create", "fit_2"),
+                                  ("start", "fit_0"), ("start", "fit_2"),
+                                  ("get_results", "fit_0"), ("get_results", "fit_2")]
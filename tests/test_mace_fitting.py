@@ -6,6 +6,10 @@ from wfl.fit.mace import fit
 from wfl.configset import ConfigSet
 import ase.io
 import pytest
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
 if not os.environ.get("WFL_MACE_FIT_COMMAND") and shutil.which("mace_run_train") is None:
     pytestmark = pytest.mark.skip(reason="No mace_run_train found in WFL_MACE_FIT_COMMAND or path")
@@ -18,7 +22,7 @@ def test_mace_fit_from_list(request, tmp_path, monkeypatch):
 	
     parent_path = request.path.parent
     params_file_path = parent_path / 'assets' / 'mace_fit_parameters.yaml'
-    mace_fit_params = yaml.safe_load(params_file_path.read_text())
+    mace_fit_params = yaml.load(params_file_path.read_bytes(), Loader=SafeLoader)
     filepath = parent_path / 'assets' / 'B_DFT_data_mace_ftting.xyz'
     fitting_configs = ConfigSet(ase.io.read(filepath, ":"))
 
@@ -39,7 +43,7 @@ def test_mace_fit(request, tmp_path, monkeypatch):
     parent_path = request.path.parent
     fit_config_file = parent_path / 'assets' / 'B_DFT_data_mace_ftting.xyz'
     params_file_path = parent_path / 'assets' / 'mace_fit_parameters.yaml'
-    mace_fit_params = yaml.safe_load(params_file_path.read_text())
+    mace_fit_params = yaml.load(params_file_path.read_bytes(), Loader=SafeLoader)
     fitting_configs = ConfigSet(fit_config_file) 
 
     t0 = time.time()
@@ -13,6 +13,7 @@ from ase.build import bulk
 from ase.calculators.emt import EMT
 from ase.units import fs
 from ase.md.logger import MDLogger
+from ase.neighborlist import neighbor_list
 from wfl.autoparallelize import autoparainfo
 
 from wfl.generate import md
@@ -353,6 +354,69 @@ def test_md_abort_function(cu_slab):
     assert len(list(atoms_traj)) < 501
 
 
+def _collision_ref_ok(atoms, collision_radius):
+    return len(neighbor_list('i', atoms, collision_radius)) == 0
+
+
+def _random_H_atoms(rng, cell, pbc):
+    return Atoms('H' * 10, positions=rng.uniform(-2.0, 10.0, (10, 3)), cell=cell, pbc=pbc)
+
+
+@pytest.mark.parametrize("cell_type", ["nonperiodic", "orthorhombic", "skewed", "mixed_pbc", "small"])
+def test_collision_matches_neighbor_list(cell_type):
+    rng = np.random.default_rng(5)
+
+    n_collided = 0
+    for _ in range(50):
+        L = rng.uniform(3.0, 8.0, 3)
+        if cell_type == "nonperiodic":
+            atoms = _random_H_atoms(rng, None, False)
+        elif cell_type == "orthorhombic":
+            atoms = _random_H_atoms(rng, np.diag(L), True)
+        elif cell_type == "skewed":
+            atoms = _random_H_atoms(rng, [[L[0], 0.5, 0.0], [0.0, L[1], 0.0], [0.0, 0.0, L[2]]], True)
+        elif cell_type == "mixed_pbc":
+            atoms = _random_H_atoms(rng, np.diag(L), [True, True, False])
+        else:
+            # cell smaller than twice radius, atoms can collide with own images
+            atoms = Atoms('H', positions=[[0.0, 0.0, 0.0]], cell=np.diag([1.5, 5.0, 5.0]), pbc=True)
+
+        if cell_type == "small":
+            collision_radius = rng.uniform(1.6, 2.0)
+        else:
+            collision_radius = rng.uniform(0.5, 1.6)
+        ok = AbortOnCollision(collision_radius).atoms_ok(atoms)
+        assert ok == _collision_ref_ok(atoms, collision_radius)
+        n_collided += not ok
+
+    # make sure both outcomes were actually tested
+    if cell_type != "small":
+        assert 0 < n_collided < 50
+    else:
+        assert n_collided == 50
+
+
+@pytest.mark.parametrize("x0", [-1.0e-20, 0.0, 10.0 - 1.0e-15, 10.0])
+def test_collision_orthorhombic_boundary(x0):
+    for dx, expected_ok in [(0.5, False), (3.0, True)]:
+        atoms = Atoms('H2', positions=[[x0, 5.0, 5.0], [x0 + dx, 5.0, 5.0]], cell=np.diag([10.0, 10.0, 10.0]), pbc=True)
+        assert AbortOnCollision(1.0).atoms_ok(atoms) == expected_ok == _collision_ref_ok(atoms, 1.0)
+
+        # collision across periodic boundary
+        atoms = Atoms('H2', positions=[[x0, 5.0, 5.0], [x0 - dx, 5.0, 5.0]], cell=np.diag([10.0, 10.0, 10.0]), pbc=True)
+        assert AbortOnCollision(1.0).atoms_ok(atoms) == expected_ok == _collision_ref_ok(atoms, 1.0)
+
+
+def test_collision_stop():
+    stopper = AbortOnCollision(1.0, n_failed_steps=2)
+    ok_atoms = Atoms('H2', positions=[[0.0, 0.0, 0.0], [3.0, 0.0, 0.0]])
+    bad_atoms = Atoms('H2', positions=[[0.0, 0.0, 0.0], [0.5, 0.0, 0.0]])
+
+    assert not stopper.stop(ok_atoms)
+    assert not stopper.stop(bad_atoms)
+    assert stopper.stop(bad_atoms)
+
+
 def test_md_attach_logger(cu_slab, tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
 
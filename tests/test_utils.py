@@ -8,6 +8,7 @@ from pytest import approx, raises
 from wfl.configset import ConfigSet, OutputSpec
 
 from wfl.utils import misc
+from wfl.utils import parallel
 from wfl.utils.replace_eval_in_strs import replace_eval_in_strs
 from wfl.utils.save_calc_results import save_calc_results
 
@@ -131,3 +132,46 @@ def test_config_type_update():
                  update_config_type=False)
     for at in ci:
         assert at.info["config_type"].startswith("optimize_")
+
+
+n_constructed = []
+
+
+def _emt_from_files(*files, model_paths=None):
+    n_constructed.append(files)
+    return EMT()
+
+
+def test_calculator_cache_files(tmp_path, empty_calculator_cache):
+    model_file = tmp_path / "model"
+    model_file.write_text("0")
+
+    # file nested in list is checked for modifications
+    recipe = (_emt_from_files, None, {"model_paths": [str(model_file)]})
+    calc = parallel.construct_calculator_picklesafe_cached(recipe)
+    assert parallel.construct_calculator_picklesafe_cached(recipe) is calc
+
+    model_file.write_text("10")
+    new_calc = parallel.construct_calculator_picklesafe_cached(recipe)
+    assert new_calc is not calc
+    # stale calculator for the same recipe is replaced, not kept alongside
+    assert len(parallel._constructed_calculators) == 1
+    assert parallel.construct_calculator_picklesafe_cached(recipe) is new_calc
+
+
+def test_calculator_cache_many_recipes(tmp_path, empty_calculator_cache):
+    n_constructed.clear()
+    recipes = [(_emt_from_files, [str(tmp_path / f"model_{i}")], None) for i in range(6)]
+
+    for _ in range(3):
+        calcs = [parallel.construct_calculator_picklesafe_cached(recipe) for recipe in recipes]
+        assert len(set(id(calc) for calc in calcs)) == len(recipes)
+
+    # each distinct recipe built only once
+    assert len(n_constructed) == len(recipes)
+    assert len(parallel._constructed_calculators) == len(recipes)
+
+
+def test_calculator_cache_malformed_recipe(empty_calculator_cache):
+    with raises(RuntimeError, match="must be"):
+        parallel.construct_calculator_picklesafe_cached((EMT,))
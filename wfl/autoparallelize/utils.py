@@ -7,6 +7,8 @@ import re
 import warnings
 import itertools
 import inspect
+import copy
+import functools
 
 import numpy as np
 
@@ -38,6 +40,42 @@ def grouper(n, iterable):
         yield chunk
 
 
+def _load_env_remote_info(env_value):
+    """parse remote_info env var content, JSON/YAML or name of JSON/YAML file, reusing
+    previous parse if content (or file) is unchanged
+
+    Returns
+    -------
+    remote_info: dict, copy that may be modified by caller
+    """
+    try:
+        remote_info = _safe_load_str_cached(env_value)
+    except Exception as exc:
+        remote_info = env_value
+        if ' ' in remote_info:
+            # if it's not JSON, it must be a filename, so presence of space is suspicious
+            warnings.warn(f'remote_info "{remote_info}" from WFL_EXPYRE_INFO has whitespace, but not parseable as '
+                          f'JSON/YAML with error {exc}')
+    if isinstance(remote_info, str):
+        # filename
+        remote_info = _safe_load_file_cached(remote_info, os.stat(remote_info).st_mtime_ns)
+
+    # RemoteInfo keeps references to lists, e.g. env_vars, which callers may modify
+    return copy.deepcopy(remote_info)
+
+
+@functools.lru_cache(maxsize=16)
+def _safe_load_str_cached(content):
+    return yaml.safe_load(io.StringIO(content))
+
+
+@functools.lru_cache(maxsize=16)
+def _safe_load_file_cached(filename, mtime_ns):
+    # mtime_ns is only used as part of cache key
+    with open(filename) as fin:
+        return yaml.safe_load(fin)
+
+
 def get_remote_info(remote_info, remote_label, env_var="WFL_EXPYRE_INFO"):
     """get remote_info dict from passed in dict, label, and/or env. var
 
@@ -57,20 +95,12 @@ def get_remote_info(remote_info, remote_label, env_var="WFL_EXPYRE_INFO"):
     -------
     remote_info: RemoteInfo or None
     """
+    if isinstance(remote_info, RemoteInfo):
+        # already resolved
+        return remote_info
+
     if remote_info is None and env_var in os.environ:
-        try:
-            env_var_stream = io.StringIO(os.environ[env_var])
-            remote_info = yaml.safe_load(env_var_stream)
-        except Exception as exc:
-            remote_info = os.environ[env_var]
-            if ' ' in remote_info:
-                # if it's not JSON, it must be a filename, so presence of space is suspicious
-                warnings.warn(f'remote_info "{remote_info}" from WFL_EXPYRE_INFO has whitespace, but not parseable as '
-                              f'JSON/YAML with error {exc}')
-        if isinstance(remote_info, str):
-            # filename
-            with open(remote_info) as fin:
-                remote_info = yaml.safe_load(fin)
+        remote_info = _load_env_remote_info(os.environ[env_var])
         if 'sys_name' in remote_info:
             # remote_info directly in top level dict
             warnings.warn(f'env var {env_var} appears to be a RemoteInfo kwargs, using directly')
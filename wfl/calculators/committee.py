@@ -6,9 +6,10 @@ Further operations (eg. mean, variance, etc.) with these are up to the user.
 """
 from ase import Atoms
 
+from wfl.autoparallelize import autoparallelize, autoparallelize_docstring
 from wfl.utils.save_calc_results import per_atom_properties, per_config_properties
 from wfl.utils.misc import atoms_to_list
-from wfl.utils.parallel import construct_calculator_picklesafe
+from wfl.utils.parallel import construct_calculator_picklesafe_cached
 
 __default_properties = ['energy', 'forces', 'stress']
 
@@ -25,7 +26,8 @@ def calculate_committee(atoms, calculator_list, properties=None, output_prefix="
     atoms : Atoms / list(Atoms)
         input atomic configs
     calculator_list : list(Calculator) / list[(initializer, args, kwargs)]
-        list of calculators to use as a committee of models on the configs
+        list of calculators to use as a committee of models on the configs. Calculators
+        constructed from (initializer, args, kwargs) are reused by later calls in the same process
     properties: list[str], default ['energy', 'forces', 'stress']
         properties to calculate
     output_prefix : str, default="committee\_"
@@ -51,8 +53,8 @@ def calculate_committee(atoms, calculator_list, properties=None, output_prefix="
     else:
         key_formatter = f"{output_prefix}{{}}{{}}"
 
-    # create calculator instances
-    calculator_list_to_use = [construct_calculator_picklesafe(calc) for calc in calculator_list]
+    # create calculator instances, reusing ones previously constructed in this process
+    calculator_list_to_use = [construct_calculator_picklesafe_cached(calc) for calc in calculator_list]
 
     for at in atoms_list:
         # calculate forces and energy with all models from the committee
@@ -69,3 +71,10 @@ def calculate_committee(atoms, calculator_list, properties=None, output_prefix="
         return atoms_list[0]
     else:
         return atoms_list
+
+
+def calculate(*args, **kwargs):
+    # calculators are constructed once per group of configs, so evaluate several per subprocess
+    default_autopara_info = {"num_inputs_per_python_subprocess": 10}
+    return autoparallelize(calculate_committee, *args, default_autopara_info=default_autopara_info, **kwargs)
+autoparallelize_docstring(calculate, calculate_committee, "Atoms")
@@ -45,10 +45,11 @@ subcli_select.add_command(by_lambda)
 def subcli_eval(ctx):
     pass
 
-from wfl.cli.commands.eval import gap, ace, mace, atomization_energy
+from wfl.cli.commands.eval import gap, ace, mace, calculator, atomization_energy
 subcli_eval.add_command(gap)
 subcli_eval.add_command(ace)
 subcli_eval.add_command(mace)
+subcli_eval.add_command(calculator)
 subcli_eval.add_command(atomization_energy)
 
 
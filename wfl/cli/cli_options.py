@@ -1,10 +1,11 @@
+import copy
+import functools
 import click
 import json
-from wfl.configset import ConfigSet, OutputSpec
-from ase.io.extxyz import key_val_str_to_dict
 
 
 def _to_ConfigSet(ctx, param, value):
+    from wfl.configset import ConfigSet
     return ConfigSet(value)
 
 def inputs(f):
@@ -15,6 +16,7 @@ def inputs(f):
 
 
 def _to_OutputSpec(ctx, param, value):
+    from wfl.configset import OutputSpec
     return OutputSpec(value)
 
 
@@ -24,9 +26,15 @@ def outputs(f):
                      help="Ouput file to create OutputSpec from.")(f)
     return f
 
+@functools.lru_cache(maxsize=256)
+def _key_val_str_to_dict(value):
+    from ase.io.extxyz import key_val_str_to_dict
+    return key_val_str_to_dict(value)
+
 def _parse_extra_info(ctx, param, value):
     if value is not None:
-        return key_val_str_to_dict(value)
+        # deep copy, since cached dict (including any array values) is shared by all calls with the same string
+        return copy.deepcopy(_key_val_str_to_dict(value))
     else:
         return {}
 
@@ -1,6 +1,5 @@
 import click
 from wfl.cli import cli_options as opt
-import wfl.descriptors.quippy
 
 @click.command("quippy")
 @click.pass_context
@@ -14,6 +13,8 @@ def quippy(ctx, inputs, outputs, descriptor, key, local, force):
     calculate_descriptor(inputs, outputs, descriptor, key, local, force)
 
 def calculate_descriptor(inputs, outputs, descriptor, key, local, force):
+    import wfl.descriptors.quippy
+
     wfl.descriptors.quippy.calculate(
         inputs=inputs,
         outputs=outputs,
@@ -1,7 +1,5 @@
 import click
 from wfl.cli import cli_options as opt
-from wfl.fit.error import calc as ref_err_calc
-from wfl.fit.error import value_error_scatter, errors_dumps
 
 
 @click.command("error")
@@ -39,6 +37,9 @@ def show_error(ctx, inputs, calc_property_prefix, ref_property_prefix,
     # TODO
     # - clean up cmap
 
+    from wfl.fit.error import calc as ref_err_calc
+    from wfl.fit.error import value_error_scatter, errors_dumps
+
     errors, diffs, parity = ref_err_calc(
         inputs=inputs,
         calc_property_prefix=calc_property_prefix,
@@ -1,9 +1,9 @@
+import functools
+import importlib
+
 import click
 
-from wfl.autoparallelize import AutoparaInfo
 from wfl.cli import cli_options as opt
-from wfl.calculators import generic
-from wfl.utils import configs
 
 
 def pyjulip_ace(param_fname):
@@ -11,6 +11,15 @@ def pyjulip_ace(param_fname):
     return pyjulip.ACE1(param_fname)
 
 
+@functools.lru_cache(maxsize=None)
+def _resolve_calculator(spec):
+    """resolve 'module.path:Name' to the calculator constructor it refers to"""
+    module_name, sep, name = spec.partition(":")
+    if not sep or not module_name or not name:
+        raise click.BadParameter(f"calculator '{spec}' is not of the form 'module.path:Name'")
+    return getattr(importlib.import_module(module_name), name)
+
+
 @click.command("gap")
 @click.pass_context
 @opt.inputs
@@ -23,6 +32,8 @@ def gap(ctx, inputs, outputs, param_fname, kwargs, prop_prefix, num_inputs_per_p
     """evaluates GAP"""
 
     from quippy.potential import Potential
+    from wfl.autoparallelize import AutoparaInfo
+    from wfl.calculators import generic
 
     if prop_prefix is None:
         prop_prefix = "gap_"
@@ -50,6 +61,9 @@ def gap(ctx, inputs, outputs, param_fname, kwargs, prop_prefix, num_inputs_per_p
 def ace(ctx, inputs, outputs, param_fname, kwargs, prop_prefix, num_inputs_per_python_subprocess):
     """evaluates ACE"""
 
+    from wfl.autoparallelize import AutoparaInfo
+    from wfl.calculators import generic
+
     if prop_prefix is None:
         prop_prefix = 'ace_'
 
@@ -75,6 +89,8 @@ def mace(ctx, inputs, outputs, param_fname, kwargs, prop_prefix, num_inputs_per_
     """evaluates MACE"""
 
     from mace.calculators import MACECalculator
+    from wfl.autoparallelize import AutoparaInfo
+    from wfl.calculators import generic
 
     if prop_prefix is None:
         prop_prefix = 'mace_'
@@ -91,6 +107,36 @@ def mace(ctx, inputs, outputs, param_fname, kwargs, prop_prefix, num_inputs_per_
         autopara_info=AutoparaInfo(num_inputs_per_python_subprocess=num_inputs_per_python_subprocess))
 
 
+@click.command("calculator")
+@click.pass_context
+@opt.inputs
+@opt.outputs
+@click.option("--calculator", "-c", "calculator_spec", required=True,
+    help="Calculator constructor as 'module.path:Name', e.g. 'ase.calculators.emt:EMT'")
+@opt.kwargs
+@opt.prop_prefix
+@opt.num_inputs_per_python_subprocess
+def calculator(ctx, inputs, outputs, calculator_spec, kwargs, prop_prefix, num_inputs_per_python_subprocess):
+    """evaluates an arbitrary calculator"""
+
+    from wfl.autoparallelize import AutoparaInfo
+    from wfl.calculators import generic
+
+    calc_constructor = _resolve_calculator(calculator_spec)
+
+    if prop_prefix is None:
+        prop_prefix = calc_constructor.__name__.lower() + "_"
+
+    calc = (calc_constructor, [], kwargs)
+
+    generic.calculate(
+        inputs=inputs,
+        outputs=outputs,
+        calculator=calc,
+        output_prefix=prop_prefix,
+        autopara_info=AutoparaInfo(num_inputs_per_python_subprocess=num_inputs_per_python_subprocess))
+
+
 @click.command("atomization-energy")
 @click.pass_context
 @opt.inputs
@@ -103,6 +149,8 @@ def mace(ctx, inputs, outputs, param_fname, kwargs, prop_prefix, num_inputs_per_
 @click.option("--isolated-atom-info-value", "-v", default="default",
     help="``atoms.info['isolated_atom_info_key']`` value for isolated atoms. Defaults to \"IsolatedAtom\" or \"isolated_atom\"")
 def atomization_energy(inputs, outputs, prop_prefix, prop, isolated_atom_info_key, isolated_atom_info_value):
+    from wfl.utils import configs
+
     configs.atomization_energy(
         inputs=inputs,
         outputs=outputs,
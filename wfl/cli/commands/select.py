@@ -1,9 +1,5 @@
 import click
-import numpy as np
 from wfl.cli import cli_options as opt
-import wfl.descriptors.quippy
-import wfl.select.by_descriptor
-from wfl.select.simple import by_bool_func
 
 
 @click.command("cur")
@@ -21,6 +17,9 @@ def cur(ctx, inputs, outputs, n_configs, key, keep_descriptor,
                 kernel_exponent, deterministic, stochastic_seed):
     """Select structures by CUR"""
 
+    import numpy as np
+    import wfl.select.by_descriptor
+
     wfl.select.by_descriptor.CUR_conf_global(
         inputs=inputs,
         outputs=outputs,
@@ -39,6 +38,8 @@ help='String to be evaluated by the lambda function. Will be substituted into `e
 def by_lambda(ctx, inputs, outputs, exec_code):
     """selects atoms based on a lambda function"""
 
+    from wfl.select.simple import by_bool_func
+
     at_filter_fun = eval("lambda atoms: " + exec_code)
 
     by_bool_func(
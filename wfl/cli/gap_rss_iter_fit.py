@@ -1073,12 +1073,23 @@ def flat_histo_then_by_desc(run_dir, configs, file_label, grp_label, Zs,
         print_log(
             f'computing descriptors and selecting from (optionally) flat histogram by descriptor for {file_label} ' + str(
                 config_selection_descriptor_strs))
+        selected_outputs = OutputSpec(f'{file_label}_by_desc.{grp_label}.xyz', file_root=run_dir)
+        testing_outputs = OutputSpec(f'{file_label}_testing.{grp_label}.xyz', file_root=run_dir)
+
         # calc descriptors and by-desc select from flat histo selected
-        configs_flat_histo_with_desc = wfl.descriptors.quippy.calculate(
-            configs_init, OutputSpec(f'{file_label}_with_desc.{grp_label}.xyz', file_root=run_dir),
-            config_selection_descriptor_strs, 'config_selection_desc',
-            per_atom=config_selection_descriptor_local,
-            verbose=verbose)
+        # descriptors are only needed for selection, so keep them in an array in memory rather than
+        # writing them to an xyz file and parsing it again for each selection, and skip calculating
+        # them if selection was already done
+        if selected_outputs.all_written() and (testing_N <= 0 or testing_outputs.all_written()):
+            at_descs = None
+        else:
+            configs_with_desc = wfl.descriptors.quippy.calculate(
+                configs_init, OutputSpec(),
+                config_selection_descriptor_strs, 'config_selection_desc',
+                per_atom=config_selection_descriptor_local,
+                verbose=verbose)
+            at_descs = np.asarray([at.info.pop('config_selection_desc') for at in configs_with_desc])
+            del configs_with_desc
 
         # no kwargs as default
         extra_kwargs = {}
@@ -1094,16 +1105,14 @@ def flat_histo_then_by_desc(run_dir, configs, file_label, grp_label, Zs,
         else:
             raise RuntimeError(f'Unknown method for selection by descriptor "{select_by_desc_method}"')
 
-        configs_selected = selector_func(configs_flat_histo_with_desc,
-                                        OutputSpec(f'{file_label}_by_desc.{grp_label}.xyz', file_root=run_dir),
-                                        num=by_desc_select_N, at_descs_info_key='config_selection_desc',
-                                        keep_descriptor_info=False, exclude_list=by_desc_exclude_list, **extra_kwargs)
+        configs_selected = selector_func(configs_init, selected_outputs,
+                                        num=by_desc_select_N, at_descs=at_descs,
+                                        exclude_list=by_desc_exclude_list, **extra_kwargs)
         if testing_N > 0:
             by_desc_exclude_list = ConfigSet([by_desc_exclude_list, configs_selected])
-            testing_configs = selector_func(configs_flat_histo_with_desc,
-                                            OutputSpec(f'{file_label}_testing.{grp_label}.xyz', file_root=run_dir),
-                                            num=testing_N, at_descs_info_key='config_selection_desc',
-                                            keep_descriptor_info=False, exclude_list=by_desc_exclude_list, **extra_kwargs)
+            testing_configs = selector_func(configs_init, testing_outputs,
+                                            num=testing_N, at_descs=at_descs,
+                                            exclude_list=by_desc_exclude_list, **extra_kwargs)
         else:
             testing_configs = None
 
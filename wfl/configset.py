@@ -446,10 +446,11 @@ class OutputSpec:
             if len(absolute_files) > 0 and self.file_root != Path(""):
                 raise ValueError(f"Got file_root {file_root} but files {absolute_files} are absolute paths")
             self.files = [Path(f) for f in self.files]
+            # temporary names that files are written to until close()
+            self._tmp_files = [self.file_root / f.with_name("tmp." + f.name) for f in self.files]
 
             # wipe tmp files
-            for f in self.files:
-                tmp_f = self.file_root / f.parent / ("tmp." + f.name)
+            for tmp_f in self._tmp_files:
                 tmp_f.unlink(missing_ok=True)
         else:
             # store in memory
@@ -604,8 +605,7 @@ class OutputSpec:
         if self.files is not None:
             if self.cur_file is not None:
                 self.cur_file.close()
-            for f in self.files:
-                tmp_f = self.file_root / f.parent / ("tmp." + f.name)
+            for f, tmp_f in zip(self.files, self._tmp_files):
                 if tmp_f.exists():
                     tmp_f.rename(self.file_root / f)
 
@@ -687,7 +687,7 @@ class OutputSpec:
 
         self.cur_file_ind = file_ind
 
-        tmp_filename = self.file_root / self.files[self.cur_file_ind].parent / ("tmp." + self.files[self.cur_file_ind].name)
+        tmp_filename = self._tmp_files[self.cur_file_ind]
 
         self._cur_write_kwargs = self.write_kwargs.copy()
         if "format" not in self._cur_write_kwargs:
@@ -122,7 +122,10 @@ def calc(inputs, calc_property_prefix, ref_property_prefix,
 
     missed_prop_counter = {}
 
-    for at_idx, at in enumerate(inputs):
+    # count configs while iterating, so inputs (e.g. a file-based ConfigSet) is only read once
+    n_configs = 0
+    for at in inputs:
+        n_configs += 1
         # turn category keys into a single string for dict key
         at_category = " / ".join([str(at.info.get(k)) for k in category_keys])
         weight = at.info.get(weight_property, 1.0)
@@ -221,7 +224,7 @@ def calc(inputs, calc_property_prefix, ref_property_prefix,
 
     if len(missed_prop_counter.keys()) > 0:
         for missed_prop, count in missed_prop_counter.items():
-            if count == len(list(inputs)):
+            if count == n_configs:
                 raise RuntimeError(f"Missing reference ({ref_property_prefix}) or calculated ({calc_property_prefix}) "
                                     f"property '{missed_prop}' in all of the configs. Is the spelling correct? ")
             else:
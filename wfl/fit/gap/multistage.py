@@ -74,10 +74,11 @@ def prep_params(Zs, length_scales, GAP_template, spacing=1.5,
 
 
 def _select_info(ats, info_keys):
+    info_keys = set(info_keys)
     for at in ats:
-        for k in list(at.info.keys()):
-            if k not in info_keys:
-                del at.info[k]
+        # set difference creates a new set, so it is safe to delete while iterating over it
+        for k in at.info.keys() - info_keys:
+            del at.info[k]
 
 
 # WARNING: this is hardwired to the names of fields in specific descriptors
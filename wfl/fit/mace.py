@@ -1,10 +1,15 @@
 import os
 import sys
 import subprocess
+import shlex
 import shutil
 import warnings
 import tempfile
+import copy
+import functools
+import inspect
 
+import yaml
 import ase.io
 
 from expyre import ExPyRe
@@ -16,7 +21,7 @@ from shutil import copyfile
 
 def fit(fitting_configs, mace_name, mace_fit_params, mace_fit_cmd=None, ref_property_prefix="REF_",
         prev_checkpoint_file=None, valid_configs=None, test_configs=None, skip_if_present=True, run_dir=".",
-        verbose=True, dry_run=False, remote_info=None, remote_label=None, wait_for_results=True):
+        verbose=True, dry_run=False, params_file=True, remote_info=None, remote_label=None, wait_for_results=True):
     """
         Fit MACE model.
 
@@ -33,11 +38,12 @@ def fit(fitting_configs, mace_name, mace_fit_params, mace_fit_cmd=None, ref_prop
        set of configurations to fit (mace param "train_file")
     mace_name: str
         name of MACE label
-    mace_fit_params: dict
-        parameters for fitting a MACE model.
+    mace_fit_params: dict or str / Path
+        parameters for fitting a MACE model, or name of YAML file containing them
     mace_fit_cmd: str, default None.
         command for excecuting the MACE fitting. (For example, "python ~/path_to_mace_cripts/run_train.py")
-        Alternatively set by `WFL_MACE_FIT_COMMAND` env var.
+        Alternatively set by `WFL_MACE_FIT_COMMAND` env var.  Split into arguments with env vars and ~ expanded,
+        but not run through a shell.
     ref_property_prefix: str, default "REF_"
         string prefix added to atoms.info/arrays keys (energy, forces, virial, stress)
     prev_checkpoint_file: str, default None
@@ -54,6 +60,9 @@ def fit(fitting_configs, mace_name, mace_fit_params, mace_fit_cmd=None, ref_prop
         verbose output
     dry_run: bool, default False
         do a dry run, and returns fitting command including keywords
+    params_file: bool, default True
+        pass parameters to MACE in a YAML file with its `--config` argument, rather than
+        as separate command line arguments
     remote_info: dict or wfl.autoparallelize.utils.RemoteInfo, or '_IGNORE' or None
         If present and not None and not '_IGNORE', RemoteInfo or dict with kwargs for RemoteInfo
         constructor which triggers running job in separately queued job on remote machine.  If None,
@@ -67,73 +76,20 @@ def fit(fitting_configs, mace_name, mace_fit_params, mace_fit_cmd=None, ref_prop
     """
     run_dir = Path(run_dir)
 
-    # fill in some params from standard function arguments
-    mace_fit_params["name"] = mace_name
-    mace_fit_params["energy_key"] = ref_property_prefix + "energy"
-    mace_fit_params["forces_key"] = ref_property_prefix + "forces"
-    if "compute_stress" in mace_fit_params:
-        mace_fit_params["stress_key"] = ref_property_prefix + "stress"
-
-    assert isinstance(mace_fit_params, dict)
-    if prev_checkpoint_file is not None:
-        assert Path(prev_checkpoint_file).is_file(), "No previous checkpoint file found!"
-
-    if skip_if_present:
-        try:
-            print(f"check whether already fitted model exists as {run_dir}/{mace_name}.model")
-            if not Path(f"{run_dir}/{mace_name}.model").is_file():
-                raise FileNotFoundError
-
-            return mace_name
-        except (FileNotFoundError, RuntimeError):
-            pass
+    mace_fit_params, model_exists = _prep_fit_params(mace_fit_params, mace_name, ref_property_prefix,
+                                                     prev_checkpoint_file, run_dir, skip_if_present, verbose)
+    if model_exists:
+        return mace_name
 
     if remote_info != '_IGNORE':
         remote_info = get_remote_info(remote_info, remote_label)
 
     if remote_info is not None and remote_info != '_IGNORE':
-        input_files = remote_info.input_files.copy()
-        # run dir will contain only things created by fitting, so it's safe to copy the
-        # entire thing back as output
-        output_files = remote_info.output_files + [str(run_dir)]
-
-        # convert to lists in memory so pickling for remote run will work
-        fitting_configs = ConfigSet(list(fitting_configs))
-        if valid_configs is not None:
-            valid_configs = ConfigSet(list(valid_configs))
-        if test_configs is not None:
-            test_configs = ConfigSet(list(test_configs))
-
-        # set number of threads in queued job, only if user hasn't set them
-        if not any([var.split('=')[0] == 'WFL_MACE_FIT_OMP_NUM_THREADS' for var in remote_info.env_vars]):
-            remote_info.env_vars.append('WFL_MACE_FIT_OMP_NUM_THREADS=$EXPYRE_NUM_CORES_PER_NODE')
-        if not any([var.split('=')[0] == 'WFL_NUM_PYTHON_SUBPROCESSES' for var in remote_info.env_vars]):
-            remote_info.env_vars.append('WFL_NUM_PYTHON_SUBPROCESSES=$EXPYRE_NUM_CORES_PER_NODE')
-
-        remote_func_kwargs = {'fitting_configs': fitting_configs, 'mace_name': mace_name,
-                              'mace_fit_params': mace_fit_params, 'remote_info': '_IGNORE', 'run_dir': run_dir,
-                              'mace_fit_cmd': mace_fit_cmd, 'prev_checkpoint_file': prev_checkpoint_file,
-                              'valid_configs': valid_configs, 'test_configs': test_configs,
-                              'ref_property_prefix': ref_property_prefix, 'verbose': verbose, 'dry_run': dry_run}
-
-        xpr = ExPyRe(name=remote_info.job_name, pre_run_commands=remote_info.pre_cmds, post_run_commands=remote_info.post_cmds,
-                     env_vars=remote_info.env_vars, input_files=input_files, output_files=output_files, function=fit,
-                     kwargs=remote_func_kwargs)
-
-        xpr.start(resources=remote_info.resources, system_name=remote_info.sys_name, header_extra=remote_info.header_extra,
-                  exact_fit=remote_info.exact_fit, partial_node=remote_info.partial_node)
-
-        if not wait_for_results:
-            return None
-        results, stdout, stderr = xpr.get_results(timeout=remote_info.timeout, check_interval=remote_info.check_interval)
-
-        sys.stdout.write(stdout)
-        sys.stderr.write(stderr)
-
-        # no outputs to rename since everything should be in run_dir
-        xpr.mark_processed()
-
-        return results
+        xpr = _remote_fit_job(remote_info, fitting_configs, mace_name, mace_fit_params, mace_fit_cmd=mace_fit_cmd,
+                              ref_property_prefix=ref_property_prefix, prev_checkpoint_file=prev_checkpoint_file,
+                              valid_configs=valid_configs, test_configs=test_configs, run_dir=run_dir,
+                              verbose=verbose, dry_run=dry_run, params_file=params_file)
+        return _run_remote_fit_jobs([xpr], remote_info, wait_for_results)[0]
 
     run_dir.mkdir(parents=True, exist_ok=True)
 
@@ -155,42 +111,49 @@ def fit(fitting_configs, mace_name, mace_fit_params, mace_fit_cmd=None, ref_prop
     if mace_fit_params.get("foundation_model", None) is not None and Path(mace_fit_params["foundation_model"]).is_file():
         mace_fit_params["foundation_model"] = str(Path(mace_fit_params["foundation_model"]).absolute())
 
-    for key, val in mace_fit_params.items():
-        if isinstance(val, int) or isinstance(val, float):
-            mace_fit_cmd += f" --{key}={val}"
-        elif isinstance(val, str):
-            mace_fit_cmd += f" --{key}='{val}'"
-        elif val is None:
-            mace_fit_cmd += f" --{key}"
-        else:
-            mace_fit_cmd += f" --{key}='{val}'"
+    # split into argv, expanding env vars and ~ since command is not run by a shell
+    fit_cmd_args = [os.path.expanduser(os.path.expandvars(arg)) for arg in shlex.split(mace_fit_cmd)]
+    if params_file:
+        fd_params, params_scratch_filename = tempfile.mkstemp(prefix="_MACE_params.", suffix=".yaml", dir=run_dir)
+        with os.fdopen(fd_params, "w") as fout:
+            yaml.safe_dump(_config_file_params(mace_fit_params), fout)
+        fit_cmd_args += ["--config", str(Path(params_scratch_filename).absolute())]
+    else:
+        params_scratch_filename = None
+        for key, val in mace_fit_params.items():
+            if val is None:
+                fit_cmd_args.append(f"--{key}")
+            else:
+                fit_cmd_args.append(f"--{key}={val}")
 
     if dry_run or verbose:
-        print('fitting command:\n', mace_fit_cmd)
+        print('fitting command:\n', shlex.join(fit_cmd_args))
+        if params_file:
+            print('fitting parameters:\n', Path(params_scratch_filename).read_text())
         if dry_run:
+            if params_scratch_filename is not None:
+                Path(params_scratch_filename).unlink()
             warnings.warn("Exiting mace.fit without fitting, because dry_run is True")
             return None
 
-    orig_omp_n = os.environ.get('OMP_NUM_THREADS', None)
+    fit_env = None
     if 'WFL_MACE_FIT_OMP_NUM_THREADS' in os.environ:
-        os.environ['OMP_NUM_THREADS'] = os.environ['WFL_MACE_FIT_OMP_NUM_THREADS']
+        fit_env = os.environ.copy()
+        fit_env['OMP_NUM_THREADS'] = os.environ['WFL_MACE_FIT_OMP_NUM_THREADS']
 
     try:
-        remote_cwd = os.getcwd()
-
         # previous checkpoint file should be moved by remote_info.input_files function
         if prev_checkpoint_file is not None:
             checkpoint_dir = run_dir / "checkpoints"
             checkpoint_dir.mkdir(parents=True, exist_ok=True)
-            # check if file exists in the destination.
+            # copy rather than link, since MACE may overwrite this file in place when it saves
+            # its first checkpoint of the restarted fit
             try:
                 copyfile(prev_checkpoint_file, f"{checkpoint_dir}/{Path(prev_checkpoint_file).stem}.pt")
             except shutil.SameFileError:
                 pass
 
-        os.chdir(run_dir)
-        subprocess.run(mace_fit_cmd, shell=True, check=True)
-        os.chdir(remote_cwd)
+        subprocess.run(fit_cmd_args, cwd=run_dir, env=fit_env, check=True)
 
         if fitting_configs_scratch_filename is not None:
             Path(fitting_configs_scratch_filename).unlink()
@@ -198,13 +161,219 @@ def fit(fitting_configs, mace_name, mace_fit_params, mace_fit_cmd=None, ref_prop
             Path(valid_configs_scratch_filename).unlink()
         if test_configs is not None and test_configs_scratch_filename is not None:
             Path(test_configs_scratch_filename).unlink()
+        if params_scratch_filename is not None:
+            Path(params_scratch_filename).unlink()
 
     except subprocess.CalledProcessError as exc:
         print("Failure in calling MACE fitting with error code:", exc.returncode)
         raise exc
 
-    if orig_omp_n is not None:
-        os.environ["OMP_NUM_THREADS"] = orig_omp_n
+
+def fit_multiple(fits_kwargs, remote_info=None, remote_label=None, wait_for_results=True):
+    """Fit several MACE models.  When running remotely, all jobs are created and
+    submitted before waiting for any of them, rather than one at a time as with
+    repeated calls to :func:`fit`.
+
+    Parameters
+    ----------
+    fits_kwargs: list(dict)
+        keyword arguments for :func:`fit` for each model, excluding `remote_info`,
+        `remote_label` and `wait_for_results`
+    remote_info: dict or wfl.autoparallelize.utils.RemoteInfo, or '_IGNORE' or None
+        see :func:`fit`, used for all jobs
+    remote_label: str, default None
+        label to match in WFL_EXPYRE_INFO
+    wait_for_results: bool, default True
+        wait for results of remotely executed jobs, otherwise return after starting them
+
+    Returns
+    -------
+    results: list with return value of :func:`fit` for each model
+    """
+    if remote_info != '_IGNORE':
+        remote_info = get_remote_info(remote_info, remote_label)
+
+    if remote_info is None or remote_info == '_IGNORE':
+        return [fit(**fit_kwargs, remote_info='_IGNORE') for fit_kwargs in fits_kwargs]
+
+    remote_fit_job_args = list(inspect.signature(_remote_fit_job).parameters)[1:]
+
+    results = [None] * len(fits_kwargs)
+    xprs = []
+    xpr_inds = []
+    for fit_i, fit_kwargs in enumerate(fits_kwargs):
+        # fill in defaults of fit() for any arguments not passed explicitly
+        fit_args = inspect.signature(fit).bind(**fit_kwargs)
+        fit_args.apply_defaults()
+        fit_args = fit_args.arguments
+
+        fit_args["mace_fit_params"], model_exists = _prep_fit_params(
+            fit_args["mace_fit_params"], fit_args["mace_name"], fit_args["ref_property_prefix"],
+            fit_args["prev_checkpoint_file"], Path(fit_args["run_dir"]), fit_args["skip_if_present"], fit_args["verbose"])
+        if model_exists:
+            results[fit_i] = fit_args["mace_name"]
+            continue
+
+        xprs.append(_remote_fit_job(remote_info, **{arg: fit_args[arg] for arg in remote_fit_job_args}))
+        xpr_inds.append(fit_i)
+
+    for fit_i, result in zip(xpr_inds, _run_remote_fit_jobs(xprs, remote_info, wait_for_results)):
+        results[fit_i] = result
+
+    return results
+
+
+def _load_fit_params(params_file):
+    """Read fitting params from YAML file, reusing previous parse if file is unchanged
+
+    Returns
+    -------
+    params: dict, copy that may be modified by caller
+    """
+    params_file = Path(params_file).absolute()
+    return copy.deepcopy(_load_fit_params_cached(params_file, params_file.stat().st_mtime_ns))
+
+
+@functools.lru_cache(maxsize=64)
+def _load_fit_params_cached(params_file, mtime_ns):
+    # mtime_ns is only used as part of cache key
+    try:
+        loader = yaml.CSafeLoader
+    except AttributeError:
+        loader = yaml.SafeLoader
+    with open(params_file) as fin:
+        return yaml.load(fin, Loader=loader)
+
+
+def _prep_fit_params(mace_fit_params, mace_name, ref_property_prefix, prev_checkpoint_file, run_dir,
+                     skip_if_present, verbose):
+    """Prepare fitting params, reading them from a file if needed and filling in values from
+    standard :func:`fit` arguments, and check whether the model already exists
+
+    Returns
+    -------
+    mace_fit_params: dict
+    model_exists: bool, True if fit should be skipped because model already exists
+    """
+    if isinstance(mace_fit_params, (str, Path)):
+        mace_fit_params = _load_fit_params(mace_fit_params)
+    assert isinstance(mace_fit_params, dict)
+
+    # fill in some params from standard function arguments
+    mace_fit_params["name"] = mace_name
+    mace_fit_params["energy_key"] = ref_property_prefix + "energy"
+    mace_fit_params["forces_key"] = ref_property_prefix + "forces"
+    if "compute_stress" in mace_fit_params:
+        mace_fit_params["stress_key"] = ref_property_prefix + "stress"
+
+    if prev_checkpoint_file is not None:
+        assert Path(prev_checkpoint_file).is_file(), "No previous checkpoint file found!"
+
+    model_path = run_dir / f"{mace_name}.model"
+    if skip_if_present and model_path.is_file():
+        if verbose:
+            print(f"reusing existing model at {model_path}")
+        return mace_fit_params, True
+
+    return mace_fit_params, False
+
+
+def _remote_fit_job(remote_info, fitting_configs, mace_name, mace_fit_params, mace_fit_cmd=None, ref_property_prefix="REF_",
+                    prev_checkpoint_file=None, valid_configs=None, test_configs=None, run_dir=".", verbose=True,
+                    dry_run=False, params_file=True):
+    """Create (but do not start) ExPyRe job that runs :func:`fit` remotely
+
+    Returns
+    -------
+    xpr: ExPyRe
+    """
+    run_dir = Path(run_dir)
+
+    input_files = remote_info.input_files.copy()
+    # run dir will contain only things created by fitting, so it's safe to copy the
+    # entire thing back as output
+    output_files = remote_info.output_files + [str(run_dir)]
+
+    # convert to lists in memory so pickling for remote run will work
+    fitting_configs = ConfigSet(list(fitting_configs))
+    if valid_configs is not None:
+        valid_configs = ConfigSet(list(valid_configs))
+    if test_configs is not None:
+        test_configs = ConfigSet(list(test_configs))
+
+    # set number of threads in queued job, only if user hasn't set them
+    if not any([var.split('=')[0] == 'WFL_MACE_FIT_OMP_NUM_THREADS' for var in remote_info.env_vars]):
+        remote_info.env_vars.append('WFL_MACE_FIT_OMP_NUM_THREADS=$EXPYRE_NUM_CORES_PER_NODE')
+    if not any([var.split('=')[0] == 'WFL_NUM_PYTHON_SUBPROCESSES' for var in remote_info.env_vars]):
+        remote_info.env_vars.append('WFL_NUM_PYTHON_SUBPROCESSES=$EXPYRE_NUM_CORES_PER_NODE')
+
+    remote_func_kwargs = {'fitting_configs': fitting_configs, 'mace_name': mace_name,
+                          'mace_fit_params': mace_fit_params, 'remote_info': '_IGNORE', 'run_dir': run_dir,
+                          'mace_fit_cmd': mace_fit_cmd, 'prev_checkpoint_file': prev_checkpoint_file,
+                          'valid_configs': valid_configs, 'test_configs': test_configs,
+                          'ref_property_prefix': ref_property_prefix, 'verbose': verbose, 'dry_run': dry_run,
+                          'params_file': params_file}
+
+    # kwargs are pickled by the constructor, so later changes to mace_fit_params do not affect the job
+    return ExPyRe(name=remote_info.job_name, pre_run_commands=remote_info.pre_cmds, post_run_commands=remote_info.post_cmds,
+                  env_vars=remote_info.env_vars, input_files=input_files, output_files=output_files, function=fit,
+                  kwargs=remote_func_kwargs)
+
+
+def _run_remote_fit_jobs(xprs, remote_info, wait_for_results):
+    """Start all remote fit jobs, then gather their results
+
+    Returns
+    -------
+    results: list with result of each job, or None if not wait_for_results
+    """
+    # start all jobs before waiting for any of them, so they are all queued together
+    for xpr in xprs:
+        xpr.start(resources=remote_info.resources, system_name=remote_info.sys_name, header_extra=remote_info.header_extra,
+                  exact_fit=remote_info.exact_fit, partial_node=remote_info.partial_node)
+
+    if not wait_for_results:
+        return [None] * len(xprs)
+
+    all_results = []
+    for xpr in xprs:
+        results, stdout, stderr = xpr.get_results(timeout=remote_info.timeout, check_interval=remote_info.check_interval)
+
+        sys.stdout.write(stdout)
+        sys.stderr.write(stderr)
+
+        # no outputs to rename since everything should be in run_dir
+        xpr.mark_processed()
+
+        all_results.append(results)
+
+    return all_results
+
+
+def _config_file_params(mace_fit_params):
+    """Convert fitting params to values for a MACE `--config` YAML file, with the same
+    meaning as the corresponding command line arguments
+
+    Returns
+    -------
+    params: dict
+    """
+    params = {}
+    for key, val in mace_fit_params.items():
+        if val is None:
+            # bare flag on command line
+            params[key] = True
+        elif isinstance(val, bool) or isinstance(val, str):
+            params[key] = val
+        elif isinstance(val, int):
+            params[key] = int(val)
+        elif isinstance(val, float):
+            params[key] = float(val)
+        else:
+            # e.g. dicts of E0s, which MACE parses from a string
+            params[key] = str(val)
+
+    return params
 
 
 def _prep_configs_file(configs, use_params, key, workdir=Path()):
@@ -242,8 +411,8 @@ def _prep_configs_file(configs, use_params, key, workdir=Path()):
         return filename
 
     else:
-        # make sure this isn't a relative pathname, because the chdir that surrounds actually
-        # running the fit will break it
+        # make sure this isn't a relative pathname, because the fit is run with run_dir as its
+        # working directory
         use_params[key] = str(Path(configs_filename).absolute())
 
         return None
@@ -1,3 +1,5 @@
+import copy
+import functools
 import io
 import numbers
 import subprocess
@@ -169,6 +171,15 @@ def conv_buildcell_out(buildcell_output):
     return ats
 
 
+@functools.lru_cache(maxsize=16)
+def _input_extra_info(buildcell_input):
+    # same input is parsed for every group of configs, so cache (callers must copy)
+    extra_info = {}
+    for l in buildcell_input.splitlines():
+        if '##EXTRA_INFO' in l:
+            extra_info.update(key_val_str_to_dict(l.replace('##EXTRA_INFO', '').strip()))
+    return extra_info
+
 
 def _run_autopara_wrappable(config_is, buildcell_cmd, buildcell_input, extra_info=None,
            perturbation=0.0, skip_failures=True, symprec=0.01, verbose=False):
@@ -207,10 +218,8 @@ def _run_autopara_wrappable(config_is, buildcell_cmd, buildcell_input, extra_inf
     if verbose:
         print('repeat_buildcell calling with stdin ' + buildcell_input)
 
-    t_extra_info = {}
-    for l in buildcell_input.splitlines():
-        if '##EXTRA_INFO' in l:
-            t_extra_info.update(key_val_str_to_dict(l.replace('##EXTRA_INFO', '').strip()))
+    # deep copy, since cached dict (including any array values) is shared by all calls with the same input
+    t_extra_info = copy.deepcopy(_input_extra_info(buildcell_input))
     t_extra_info.update(extra_info)
     extra_info = t_extra_info
 
@@ -3,6 +3,7 @@ run under specified conditions
 """
 
 import numpy as np
+from scipy.spatial import cKDTree
 
 from .abort_base import AbortSimBase
 from ase.neighborlist import neighbor_list
@@ -27,12 +28,23 @@ class AbortOnCollision(AbortSimBase):
 
 
     def atoms_ok(self, atoms):
-        i = neighbor_list('i', atoms, self.collision_radius)
-
-        if len(i) > 0:
-            return False
+        pbc = atoms.pbc
+        cell = atoms.cell.array
+        if not np.any(pbc):
+            tree = cKDTree(atoms.positions)
+        elif (np.all(pbc) and np.count_nonzero(cell - np.diag(np.diag(cell))) == 0 and
+              np.all(np.diag(cell) > 2.0 * self.collision_radius)):
+            # orthorhombic cell large enough that only nearest periodic images can collide
+            box = np.diag(cell)
+            pos = np.mod(atoms.positions, box)
+            # mod of tiny negative values can round to exactly box, which cKDTree rejects
+            pos[pos >= box] = 0.0
+            tree = cKDTree(pos, boxsize=box)
         else:
-            return True
+            i = neighbor_list('i', atoms, self.collision_radius)
+            return len(i) == 0
+
+        return len(tree.query_pairs(self.collision_radius, output_type='ndarray')) == 0
 
 
 class AbortOnLowEnergy(AbortSimBase):
@@ -47,13 +59,13 @@ class AbortOnLowEnergy(AbortSimBase):
     def __init__(self, delta_E_per_atom):
         super().__init__(1)
         self.delta_E_per_atom = -np.abs(delta_E_per_atom)
-        self.initial_E_per_atom = None
+        # NaN until first step is seen
+        self.initial_E_per_atom = np.nan
 
 
     def atoms_ok(self, atoms):
         E_per_atom = atoms.get_potential_energy() / len(atoms)
-        if self.initial_E_per_atom is None:
+        if np.isnan(self.initial_E_per_atom):
             self.initial_E_per_atom = E_per_atom
             return True
-        else:
-            return (E_per_atom - self.initial_E_per_atom) >= self.delta_E_per_atom
+        return (E_per_atom - self.initial_E_per_atom) >= self.delta_E_per_atom
@@ -1,5 +1,4 @@
 from abc import ABC, abstractmethod
-import numpy as np
 
 
 class AbortSimBase(ABC):
@@ -7,8 +6,10 @@ class AbortSimBase(ABC):
     See `stop` method docstring for its default behavior.
     """
     def __init__(self, n_failed_steps=1):
-        self.ok_history = []
         self.n_failed_steps = n_failed_steps
+        # number of steps seen so far and of failed steps at the end of that sequence
+        self._n_steps = 0
+        self._n_failed_in_row = 0
 
 
     @abstractmethod
@@ -33,5 +34,9 @@ class AbortSimBase(ABC):
         """Returns a boolean indicating whether `wfl.generate.md.sample()` should stop
         the simulation. Defaults to aborting if `n_failed_steps` in a row `atoms_ok()`
         are evaluated to False. Derrived classes may overwrite this."""
-        self.ok_history.append(self.atoms_ok(at))
-        return np.all(np.logical_not(np.array(self.ok_history[-self.n_failed_steps:])))
+        is_ok = self.atoms_ok(at)
+
+        self._n_steps += 1
+        self._n_failed_in_row = 0 if is_ok else self._n_failed_in_row + 1
+        # every step in window of (up to) last n_failed_steps failed
+        return self._n_failed_in_row >= min(self._n_steps, self.n_failed_steps)
@@ -1,30 +1,45 @@
 import os
+import re
 import shutil
 import sys
 import tempfile
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 from ase.optimize.minimahopping import MinimaHopping
-from ase.io.trajectory import Trajectory
 import ase.io
 
 from wfl.autoparallelize import autoparallelize, autoparallelize_docstring
 from wfl.utils.save_calc_results import at_copy_save_calc_results
 from wfl.utils.misc import atoms_to_list
 from .utils import save_config_type
-from wfl.utils.parallel import construct_calculator_picklesafe
+from wfl.utils.parallel import construct_calculator_picklesafe_cached
+
+
+# newer ASE MinimaHopping can use a np.random.Generator instead of the global numpy RNG
+_minhop_accepts_rng = 'rng' in MinimaHopping._default_settings
+
+_md_traj_re = re.compile(r"md(\d+)\.traj$")
 
 
 def _get_MD_trajectory(rundir, update_config_type, prefix):
 
     md_traj = []
-    mdtrajfiles = sorted([file for file in Path(rundir).glob("md*.traj")])
-    for mdtraj in mdtrajfiles:
-        for at in ase.io.read(f"{mdtraj}", ":"):
-            new_config = at_copy_save_calc_results(at, prefix=prefix)
-            save_config_type(new_config, update_config_type, 'minhop_traj')
-            md_traj.append(new_config)
+    # sort by MD run number, which is not guaranteed to be in lexicographic order once it
+    # overflows the zero padding of the file name
+    mdtrajfiles = sorted([file for file in Path(rundir).glob("md*.traj") if _md_traj_re.match(file.name)],
+                         key=lambda file: int(_md_traj_re.match(file.name).group(1)))
+    if len(mdtrajfiles) == 0:
+        return md_traj
+
+    # read files concurrently, map() keeps results in file order
+    with ThreadPoolExecutor(max_workers=min(8, len(mdtrajfiles))) as executor:
+        mdtraj_configs = list(executor.map(lambda mdtraj: ase.io.read(f"{mdtraj}", ":"), mdtrajfiles))
+
+    for configs in mdtraj_configs:
+        md_traj.extend([at_copy_save_calc_results(at, prefix=prefix) for at in configs])
+    save_config_type(md_traj, update_config_type, 'minhop_traj')
 
     return md_traj
 
@@ -41,41 +56,42 @@ def _atom_opt_hopping(atom, calculator, Ediff0, T0, minima_threshold, mdmin,
     else:
         workdir = Path(workdir)
 
-    rundir = tempfile.mkdtemp(dir=workdir, prefix='Opt_hopping_')
+    rundir = Path(tempfile.mkdtemp(dir=workdir, prefix='Opt_hopping_')).absolute()
 
-    os.chdir(rundir)
-    atom.calc = calculator
     try:
-        opt = MinimaHopping(atom, Ediff0=Ediff0, T0=T0, minima_threshold=minima_threshold,
-                            mdmin=mdmin, fmax=fmax, timestep=timestep, **opt_kwargs)
-        opt(totalsteps=totalsteps)
-    except Exception as exc:
-        # optimization may sometimes fail to converge.
-        if skip_failures:
-            sys.stderr.write(f'Structure optimization failed with exception \'{exc}\'\n')
-            sys.stderr.flush()
-            os.chdir(workdir)
-            shutil.rmtree(rundir)
-            os.chdir(origdir)
-            return None
-        else:
-            raise
-    else:
+        atom.calc = calculator
+        try:
+            # MinimaHopping reads and writes all its files in the current directory
+            os.chdir(rundir)
+            try:
+                opt = MinimaHopping(atom, Ediff0=Ediff0, T0=T0, minima_threshold=minima_threshold,
+                                    mdmin=mdmin, fmax=fmax, timestep=timestep, **opt_kwargs)
+                opt(totalsteps=totalsteps)
+            finally:
+                os.chdir(origdir)
+        except Exception as exc:
+            # optimization may sometimes fail to converge.
+            if skip_failures:
+                sys.stderr.write(f'Structure optimization failed with exception \'{exc}\'\n')
+                sys.stderr.flush()
+                return None
+            else:
+                raise
+
         traj = []
         if return_all_traj:
             traj += _get_MD_trajectory(rundir, update_config_type, prefix=results_prefix)
 
-        for hop_traj in Trajectory('minima.traj'):
-            new_config = at_copy_save_calc_results(hop_traj, prefix=results_prefix)
-            save_config_type(new_config, update_config_type, 'minhop_min')
-            traj.append(new_config)
-        if not save_tmpdir:
-            os.chdir(workdir)
-            shutil.rmtree(rundir)
-        os.chdir(origdir)
-        return traj
+        minima = [at_copy_save_calc_results(hop_traj, prefix=results_prefix)
+                  for hop_traj in ase.io.read(rundir / 'minima.traj', ':')]
+        save_config_type(minima, update_config_type, 'minhop_min')
+        traj += minima
 
-    os.chdir(origdir)
+        return traj
+    finally:
+        # clean up on every path, including exceptions, unless asked to keep
+        if not save_tmpdir:
+            shutil.rmtree(rundir, ignore_errors=True)
 
 
 def _run_autopara_wrappable(atoms, calculator, Ediff0=1, T0=1000, minima_threshold=0.5, mdmin=2,
@@ -89,7 +105,8 @@ def _run_autopara_wrappable(atoms, calculator, Ediff0=1, T0=1000, minima_thresho
     atoms: list(Atoms)
         input configs
     calculator: Calculator / (initializer, args, kwargs)
-        ASE calculator or routine to call to create calculator
+        ASE calculator or routine to call to create calculator.  Calculators constructed from
+        (initializer, args, kwargs) are reused by later calls in the same process
     Ediff0: float, default 1 (eV)
         initial energy acceptance threshold
     T0: float, default 1000 (K)
@@ -123,14 +140,18 @@ def _run_autopara_wrappable(atoms, calculator, Ediff0=1, T0=1000, minima_thresho
         list(Atoms) trajectories
     """
 
-    calculator = construct_calculator_picklesafe(calculator)
+    calculator = construct_calculator_picklesafe_cached(calculator)
     all_trajs = []
 
     for at_i, at in enumerate(atoms_to_list(atoms)):
         if _autopara_per_item_info is not None:
-            # minima hopping doesn't let you pass in a np.random.Generator, so set a global seed using
-            # current generator
-            np.random.seed(_autopara_per_item_info[at_i]["rng"].integers(2 ** 32))
+            item_rng = _autopara_per_item_info[at_i]["rng"]
+            if _minhop_accepts_rng:
+                opt_kwargs["rng"] = item_rng
+            else:
+                # older ASE minima hopping doesn't let you pass in a np.random.Generator, so set
+                # a global seed using current generator
+                np.random.seed(item_rng.integers(2 ** 32))
 
         traj = _atom_opt_hopping(atom=at, calculator=calculator, Ediff0=Ediff0, T0=T0, minima_threshold=minima_threshold,
                                  mdmin=mdmin, fmax=fmax, timestep=timestep, totalsteps=totalsteps,
@@ -6,7 +6,7 @@ def save_config_type(at, action, config_type):
 
     parameters:
     -----------
-    at: Atoms:
+    at: Atoms / list(Atoms)
         objects to store config type in
     action: "append" | "overwrite" | False
         action to perform on additional config type string
@@ -19,7 +19,12 @@ def save_config_type(at, action, config_type):
     if action not in ["append", "overwrite"]:
         raise ValueError(f"action {action} not 'append' or 'overwrite'")
 
-    if action == 'append' and 'config_type' in at.info:
-        at.info['config_type'] += ':' + config_type
-    else:
-        at.info['config_type'] = config_type
+    if isinstance(at, Atoms):
+        at = [at]
+
+    append = action == 'append'
+    for at_i in at:
+        if append and 'config_type' in at_i.info:
+            at_i.info['config_type'] += ':' + config_type
+        else:
+            at_i.info['config_type'] = config_type
@@ -1,3 +1,6 @@
+import os
+import pickle
+
 # https://gitlab.com/ase/ase/-/issues/1140
 try:
     from ase.calculators.calculator import BaseCalculator, Calculator
@@ -49,3 +52,71 @@ def construct_calculator_picklesafe(calculator):
             c_kwargs = calculator[2]
 
         return calculator[0](*c_args, **c_kwargs)
+
+
+# calculators constructed from (initializer, args, kwargs) recipes, kept for the lifetime of the
+# (possibly pool worker) process so that expensive ones (e.g. GAP, which parses its xml file) are
+# not reconstructed for every group of configs.  Maps recipe to (state of files it refers to,
+# calculator), with only the calculator for the current state of the files kept for each recipe
+_constructed_calculators = {}
+
+
+def construct_calculator_picklesafe_cached(calculator):
+    """Like `construct_calculator_picklesafe`, but calculators constructed from a
+    (initializer, args, kwargs) recipe are reused by later calls in the same process
+    with an identical recipe, as long as any files in args/kwargs are unchanged
+
+    Parameters
+    ----------
+    calculator: Calculator / (initializer, args, kwargs)
+        ASE calculator or routine to call to create calculator
+
+    Returns
+    -------
+    calculator: Calculator
+        ase calculator object
+    """
+    if (isinstance(calculator, _calc_types) or not isinstance(calculator, (tuple, list)) or
+            len(calculator) != 3):
+        # uncached path also reports malformed recipes
+        return construct_calculator_picklesafe(calculator)
+
+    args = calculator[1] if calculator[1] is not None else []
+    kwargs = calculator[2] if calculator[2] is not None else {}
+    try:
+        key = pickle.dumps(calculator)
+    except Exception:
+        return construct_calculator_picklesafe(calculator)
+    # state of any files recipe refers to, so modified files are reloaded
+    file_state = _files_state(list(args) + list(kwargs.values()))
+
+    cached = _constructed_calculators.get(key)
+    if cached is not None and cached[0] == file_state:
+        return cached[1]
+
+    # drop any stale calculator for this recipe before constructing its replacement
+    _constructed_calculators.pop(key, None)
+    calc = construct_calculator_picklesafe(calculator)
+    _constructed_calculators[key] = (file_state, calc)
+
+    return calc
+
+
+def _files_state(arg):
+    """Modification time and size of all files named in arg, including inside (nested)
+    lists, tuples and dict values
+
+    Returns
+    -------
+    state: list(tuple(str, int, int))
+    """
+    if isinstance(arg, (str, os.PathLike)):
+        if os.path.isfile(arg):
+            stat = os.stat(arg)
+            return [(os.fspath(arg), stat.st_mtime_ns, stat.st_size)]
+        return []
+    if isinstance(arg, dict):
+        arg = list(arg.values())
+    if isinstance(arg, (list, tuple)):
+        return [state for sub_arg in arg for state in _files_state(sub_arg)]
+    return []